@@ -4,6 +4,7 @@ from __future__ import annotations
 import inspect
 import random
 import string
+import threading
 from dataclasses import asdict, dataclass, field
 from typing import (
     TYPE_CHECKING,
@@ -15,6 +16,7 @@ from typing import (
     Literal,
     Mapping,
     Optional,
+    Union,
 )
 from uuid import uuid4
 
@@ -27,6 +29,7 @@ from marimo._ast.errors import (
     MultipleDefinitionError,
     UnparsableError,
 )
+from marimo._cli.parse_args import args_from_argv
 from marimo._config.config import MarimoConfig, WidthType
 from marimo._config.utils import load_config
 from marimo._messaging.mimetypes import KnownMimeType
@@ -54,6 +57,15 @@ if TYPE_CHECKING:
 LOGGER = _loggers.marimo_logger()
 
 
+def _max_workers(parallel: Any) -> Optional[int]:
+    """Number of threads to run cells on; None uses the pool's default."""
+    if parallel is True or parallel == "":
+        return None
+    if isinstance(parallel, int) and parallel > 1:
+        return parallel
+    return 1
+
+
 @dataclass
 class _AppConfig:
     """Program-specific configuration.
@@ -169,7 +181,9 @@ class App:
 
         self._cell_manager = CellManager(prefix=cell_prefix)
         self._graph = dataflow.DirectedGraph()
-        self._execution_context: ExecutionContext | None = None
+        # cells can run concurrently on worker threads (see `run`), so the
+        # execution context is tracked per thread
+        self._execution_context = threading.local()
         self._runner = dataflow.Runner(self._graph)
 
         self._unparsable = False
@@ -300,10 +314,31 @@ class App:
 
     def run(
         self,
+        parallel: Optional[Union[bool, int]] = None,
     ) -> tuple[Sequence[Any], Mapping[str, Any]]:
+        """Run the notebook as a script.
+
+        **Args.**
+
+        - `parallel`: run cells that don't depend on each other concurrently,
+          on a pool of threads; pass an integer to set the number of threads.
+          Only applies to notebooks without async cells. Defaults to the
+          `--marimo-parallel` command-line flag (e.g.,
+          `python notebook.py --marimo-parallel=4`), or `False` if not given.
+
+        **Returns.**
+
+        - A tuple of the notebook's outputs and its definitions.
+        """
         self._maybe_initialize()
         outputs, glbls = AppScriptRunner(
-            InternalApp(self), filename=self._filename
+            InternalApp(self),
+            filename=self._filename,
+            max_workers=_max_workers(
+                args_from_argv().get("marimo-parallel", False)
+                if parallel is None
+                else parallel
+            ),
         ).run()
         return (self._flatten_outputs(outputs), self._globals_to_defs(glbls))
 
@@ -612,12 +647,12 @@ class InternalApp:
 
     @property
     def execution_context(self) -> ExecutionContext | None:
-        return self._app._execution_context
+        return getattr(self._app._execution_context, "value", None)
 
     def set_execution_context(
         self, execution_context: ExecutionContext | None
     ) -> None:
-        self._app._execution_context = execution_context
+        self._app._execution_context.value = execution_context
 
     @property
     def runner(self) -> dataflow.Runner:
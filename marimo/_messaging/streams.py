@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import contextlib
 import io
+import json
 import os
 import sys
 import threading
@@ -22,12 +23,14 @@ from marimo._messaging.cell_output import CellChannel
 from marimo._messaging.console_output_worker import ConsoleMsg, buffered_writer
 from marimo._messaging.mimetypes import KnownMimeType
 from marimo._messaging.types import (
+    EncodedKernelMessage,
     KernelMessage,
     Stderr,
     Stdin,
     Stdout,
     Stream,
 )
+from marimo._plugins.core.json_encoder import WebComponentEncoder
 from marimo._server.types import QueueType
 
 if TYPE_CHECKING:
@@ -61,17 +64,79 @@ OUTPUT_MAX_BYTES = int(os.getenv("MARIMO_OUTPUT_MAX_BYTES", 5_000_000))
 STD_STREAM_MAX_BYTES = int(os.getenv("MARIMO_STD_STREAM_MAX_BYTES", 1_000_000))
 
 
+# Encoded messages start with the op name, so that the server can route
+# them without decoding their (possibly large) payloads
+_OP_PREFIX = b'{"op": "'
+
+
+def encode_kernel_message(op: str, data: Any) -> EncodedKernelMessage:
+    """Encode a kernel message as the JSON sent to the frontend."""
+    return json.dumps(
+        {"op": op, "data": data}, cls=WebComponentEncoder
+    ).encode("utf-8")
+
+
+def decode_kernel_message(message: EncodedKernelMessage) -> KernelMessage:
+    decoded = json.loads(message)
+    return decoded["op"], decoded["data"]
+
+
+def kernel_message_op(message: EncodedKernelMessage) -> str:
+    """Get the op name of an encoded message without decoding it."""
+    start = len(_OP_PREFIX)
+    return message[start : message.index(b'"', start)].decode("utf-8")
+
+
 class PipeProtocol(Protocol):
-    def send(self, obj: Any) -> None:
+    def send_bytes(self, buf: bytes) -> None:
         pass
 
 
 class QueuePipe:
-    def __init__(self, queue: queue.Queue[KernelMessage]):
+    def __init__(self, queue: queue.Queue[EncodedKernelMessage]):
         self._queue = queue
 
-    def send(self, obj: Any) -> None:
-        self._queue.put_nowait(obj)
+    def send_bytes(self, buf: bytes) -> None:
+        self._queue.put_nowait(buf)
+
+
+class _ThreadCellId(threading.local):
+    """The cell running on the current thread, if any."""
+
+    cell_id: Optional[CellId_t] = None
+
+
+_THREAD_CELL_ID = _ThreadCellId()
+
+
+def get_thread_cell_id() -> Optional[CellId_t]:
+    """Get the cell running on the current thread, if any."""
+    return _THREAD_CELL_ID.cell_id
+
+
+@contextlib.contextmanager
+def thread_cell_id(cell_id: CellId_t) -> Iterator[None]:
+    """Attribute console output written on this thread to a cell.
+
+    Cells that the runner executes concurrently on worker threads share a
+    single stream, so console output is attributed per thread.
+    """
+    old = _THREAD_CELL_ID.cell_id
+    _THREAD_CELL_ID.cell_id = cell_id
+    try:
+        yield
+    finally:
+        _THREAD_CELL_ID.cell_id = old
+
+
+def console_cell_id(stream: Stream) -> Optional[CellId_t]:
+    """The cell that console output written on this thread belongs to.
+
+    Threads that aren't running a cell (such as the threads forwarding
+    file descriptors) fall back to the stream's cell.
+    """
+    cell_id = _THREAD_CELL_ID.cell_id
+    return cell_id if cell_id is not None else stream.cell_id
 
 
 class ThreadSafeStream(Stream):
@@ -102,9 +167,17 @@ class ThreadSafeStream(Stream):
         self.input_queue = input_queue
 
     def write(self, op: str, data: dict[Any, Any]) -> None:
+        # Messages are encoded once, here, and sent as raw bytes: the server
+        # forwards them to the frontend without unpickling or re-encoding.
+        try:
+            message = encode_kernel_message(op, data)
+        except (TypeError, ValueError) as e:
+            LOGGER.error("Failed to encode message (op: %s): %s", op, e)
+            return
+
         with self.stream_lock:
             try:
-                self.pipe.send((op, data))
+                self.pipe.send_bytes(message)
             except OSError as e:
                 # Most likely a BrokenPipeError, caused by the
                 # server process shutting down
@@ -202,7 +275,8 @@ class ThreadSafeStdout(Stdout):
         return
 
     def _write_with_mimetype(self, data: str, mimetype: KnownMimeType) -> int:
-        assert self._stream.cell_id is not None
+        cell_id = console_cell_id(self._stream)
+        assert cell_id is not None
         if not isinstance(data, str):
             raise TypeError(
                 "write() argument must be a str, not %s" % type(data).__name__
@@ -215,7 +289,7 @@ class ThreadSafeStdout(Stdout):
         self._stream.console_msg_queue.append(
             ConsoleMsg(
                 stream=CellChannel.STDOUT,
-                cell_id=self._stream.cell_id,
+                cell_id=cell_id,
                 data=data,
                 mimetype=mimetype,
             )
@@ -262,7 +336,8 @@ class ThreadSafeStderr(Stderr):
         return
 
     def _write_with_mimetype(self, data: str, mimetype: KnownMimeType) -> int:
-        assert self._stream.cell_id is not None
+        cell_id = console_cell_id(self._stream)
+        assert cell_id is not None
         if not isinstance(data, str):
             raise TypeError(
                 "write() argument must be a str, not %s" % type(data).__name__
@@ -278,7 +353,7 @@ class ThreadSafeStderr(Stderr):
             self._stream.console_msg_queue.append(
                 ConsoleMsg(
                     stream=CellChannel.STDERR,
-                    cell_id=self._stream.cell_id,
+                    cell_id=cell_id,
                     data=data,
                     mimetype=mimetype,
                 )
@@ -313,7 +388,8 @@ class ThreadSafeStdin(Stdin):
 
     def _readline_with_prompt(self, prompt: str = "") -> str:
         """Read input from the standard in stream, with an optional prompt."""
-        assert self._stream.cell_id is not None
+        cell_id = console_cell_id(self._stream)
+        assert cell_id is not None
         if not isinstance(prompt, str):
             raise TypeError(
                 "prompt must be a str, not %s" % type(prompt).__name__
@@ -330,7 +406,7 @@ class ThreadSafeStdin(Stdin):
             self._stream.console_msg_queue.append(
                 ConsoleMsg(
                     stream=CellChannel.STDIN,
-                    cell_id=self._stream.cell_id,
+                    cell_id=cell_id,
                     data=prompt,
                     mimetype="text/plain",
                 )
@@ -10,6 +10,11 @@ from marimo._messaging.mimetypes import KnownMimeType
 # and a json representation of the message
 KernelMessage = Tuple[str, Any]
 
+# A kernel message encoded as the UTF-8 JSON text sent to the frontend,
+# {"op": ..., "data": ...}. The kernel encodes each message exactly once;
+# the server forwards the bytes to the frontend untouched.
+EncodedKernelMessage = bytes
+
 
 class Stream(abc.ABC):
     """
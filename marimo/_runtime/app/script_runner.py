@@ -2,7 +2,13 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any, Callable, Iterator
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
 
 from marimo._ast.cell import CellId_t, CellImpl
 from marimo._dependencies.dependencies import DependencyManager
@@ -26,14 +32,24 @@ from marimo._runtime.patches import (
 
 if TYPE_CHECKING:
     from marimo._ast.app import InternalApp
+    from marimo._runtime.context.types import RuntimeContext
 
 
 class AppScriptRunner:
     """Runs an app in a script context."""
 
-    def __init__(self, app: InternalApp, filename: str | None) -> None:
+    def __init__(
+        self,
+        app: InternalApp,
+        filename: str | None,
+        max_workers: Optional[int] = 1,
+    ) -> None:
         self.app = app
         self.filename = filename
+        # Number of threads on which cells that don't depend on each other
+        # run concurrently; 1 runs cells one at a time, and None uses the
+        # thread pool's default. Only applies to synchronous notebooks.
+        self.max_workers = max_workers
 
     def run(self) -> RunOutput:
         from marimo._runtime.context.script_context import (
@@ -134,15 +150,102 @@ class AppScriptRunner:
             create_main_module(file=self.filename, input_override=None)
         ) as module:
             glbls = module.__dict__
+            if self.max_workers != 1:
+                return (
+                    self._run_concurrently(glbls, post_execute_hooks),
+                    glbls,
+                )
+
             outputs: dict[CellId_t, Any] = {}
             for cell in self._cell_iterator():
-                with get_context().with_cell_id(cell.cell_id):
-                    output = execute_cell(cell, glbls, self.app.graph)
-                    for hook in post_execute_hooks:
-                        hook()
-                outputs[cell.cell_id] = output
+                outputs[cell.cell_id] = self._run_cell(
+                    cell, glbls, post_execute_hooks
+                )
         return outputs, glbls
 
+    def _run_cell(
+        self,
+        cell: CellImpl,
+        glbls: dict[str, Any],
+        post_execute_hooks: list[Callable[[], Any]],
+    ) -> Any:
+        with get_context().with_cell_id(cell.cell_id):
+            output = execute_cell(cell, glbls, self.app.graph)
+            for hook in post_execute_hooks:
+                hook()
+        return output
+
+    def _run_cell_on_worker(
+        self,
+        runtime_context: RuntimeContext,
+        cell: CellImpl,
+        glbls: dict[str, Any],
+        post_execute_hooks: list[Callable[[], Any]],
+    ) -> Any:
+        # the runtime context is thread-local
+        with runtime_context.install():
+            return self._run_cell(cell, glbls, post_execute_hooks)
+
+    def _run_concurrently(
+        self,
+        glbls: dict[str, Any],
+        post_execute_hooks: list[Callable[[], Any]],
+    ) -> dict[CellId_t, Any]:
+        """Run cells on a thread pool, as soon as their parents have run.
+
+        The first exception raised by a cell stops new cells from being
+        submitted, and is raised once the cells already running finish.
+        """
+        graph = self.app.graph
+        queue = list(self._cell_iterator())
+        cell_ids = set(cell.cell_id for cell in queue)
+        pending_parents = {
+            cell.cell_id: graph.parents[cell.cell_id] & cell_ids
+            for cell in queue
+        }
+        runtime_context = get_context()
+        outputs: dict[CellId_t, Any] = {}
+        running: dict[Future[Any], CellImpl] = {}
+        failure: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="marimo-script"
+        ) as executor:
+            while queue or running:
+                # Submit ready cells, in execution order
+                for cell in [
+                    c for c in queue if not pending_parents[c.cell_id]
+                ]:
+                    queue.remove(cell)
+                    future = executor.submit(
+                        self._run_cell_on_worker,
+                        runtime_context,
+                        cell,
+                        glbls,
+                        post_execute_hooks,
+                    )
+                    running[future] = cell
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    cell = running.pop(future)
+                    exception = future.exception()
+                    if exception is not None:
+                        failure = failure or exception
+                        queue.clear()
+                        continue
+                    outputs[cell.cell_id] = future.result()
+                    for child in graph.children[cell.cell_id]:
+                        if child in pending_parents:
+                            pending_parents[child].discard(cell.cell_id)
+
+        if failure is not None:
+            raise failure
+        return outputs
+
     async def _run_asynchronous(
         self,
         post_execute_hooks: list[Callable[[], Any]],
@@ -1,8 +1,9 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import threading
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Iterator, Optional
 
 from marimo._config.config import MarimoConfig
@@ -33,7 +34,17 @@ class KernelRuntimeContext(RuntimeContext):
     _kernel: Kernel
     # app that owns this context; None for top-level contexts
     _app: Optional[InternalApp] = None
-    _id_provider: Optional[IDProvider] = None
+    # UI element IDs are provided per thread, since the runner may execute
+    # independent cells concurrently on worker threads
+    _id_providers: threading.local = field(default_factory=threading.local)
+
+    @property
+    def _id_provider(self) -> Optional[IDProvider]:
+        return getattr(self._id_providers, "value", None)
+
+    @_id_provider.setter
+    def _id_provider(self, id_provider: Optional[IDProvider]) -> None:
+        self._id_providers.value = id_provider
 
     @property
     def graph(self) -> DirectedGraph:
@@ -4,11 +4,14 @@ from __future__ import annotations
 import contextlib
 import os
 import sys
-from typing import Iterator
+import threading
+from typing import Any, Iterator
 
 from marimo._ast.cell import CellId_t
 from marimo._messaging.streams import (
+    get_thread_cell_id,
     redirect,
+    thread_cell_id,
 )
 from marimo._messaging.types import Stderr, Stdin, Stdout, Stream
 
@@ -43,6 +46,68 @@ def dup2newfd(fd: int) -> tuple[int, int, int]:
     return fd_dup, read_fd, fd
 
 
+# Cells that the runner executes concurrently on worker threads share a
+# single redirection of the standard streams: the first cell to start
+# installs it and the last one to finish removes it. Maps id(stream) to the
+# number of cells using the redirection, and the stack that undoes it.
+_REDIRECT_LOCK = threading.Lock()
+_ACTIVE_REDIRECTS: dict[int, tuple[int, contextlib.ExitStack]] = {}
+
+
+def _restore_sys_streams(stdout: Any, stderr: Any, stdin: Any) -> None:
+    sys.stdout = stdout
+    sys.stderr = stderr
+    sys.stdin = stdin
+
+
+def _acquire_redirect(
+    cell_id: CellId_t,
+    stream: Stream,
+    stdout: Stdout | None,
+    stderr: Stderr | None,
+    stdin: Stdin | None,
+) -> None:
+    with _REDIRECT_LOCK:
+        key = id(stream)
+        if key in _ACTIVE_REDIRECTS:
+            count, stack = _ACTIVE_REDIRECTS[key]
+            _ACTIVE_REDIRECTS[key] = (count + 1, stack)
+            return
+
+        stack = contextlib.ExitStack()
+        try:
+            stack.callback(setattr, stream, "cell_id", stream.cell_id)
+            stream.cell_id = cell_id
+            if stdout is not None and stderr is not None:
+                # NB: Python doesn't allow monkey patching methods builtins,
+                # so we replace these streams outright
+                stack.callback(
+                    _restore_sys_streams, sys.stdout, sys.stderr, sys.stdin
+                )
+                sys.stdout = stdout  # type: ignore
+                sys.stderr = stderr  # type: ignore
+                sys.stdin = stdin  # type: ignore
+                # The redirect context manager relies on these being
+                # installed; they are restored after it quits
+                stack.enter_context(redirect(stdout))
+                stack.enter_context(redirect(stderr))
+        except BaseException:
+            stack.close()
+            raise
+        _ACTIVE_REDIRECTS[key] = (1, stack)
+
+
+def _release_redirect(stream: Stream) -> None:
+    with _REDIRECT_LOCK:
+        key = id(stream)
+        count, stack = _ACTIVE_REDIRECTS[key]
+        if count > 1:
+            _ACTIVE_REDIRECTS[key] = (count - 1, stack)
+            return
+        del _ACTIVE_REDIRECTS[key]
+        stack.close()
+
+
 # Redirect output stream and stdout/stderr/stdin (if they have been installed)
 @contextlib.contextmanager
 def redirect_streams(
@@ -52,40 +117,14 @@ def redirect_streams(
     stderr: Stderr | None,
     stdin: Stdin | None,
 ) -> Iterator[None]:
-    cell_id_old = stream.cell_id
-
     # In a nested context; NOOP so messages still reach the top-level cell.
-    if cell_id_old is not None:
-        try:
-            yield
-        finally:
-            ...
+    if get_thread_cell_id() is not None:
+        yield
         return
 
-    stream.cell_id = cell_id
-    if stdout is None or stderr is None:
+    with thread_cell_id(cell_id):
+        _acquire_redirect(cell_id, stream, stdout, stderr, stdin)
         try:
             yield
         finally:
-            stream.cell_id = cell_id_old
-        return
-
-    # NB: Python doesn't allow monkey patching methods builtins, so
-    # we replace these streams outright
-    py_stdout = sys.stdout
-    py_stderr = sys.stderr
-    py_stdin = sys.stdin
-    sys.stdout = stdout  # type: ignore
-    sys.stderr = stderr  # type: ignore
-    sys.stdin = stdin  # type: ignore
-
-    try:
-        with redirect(stdout), redirect(stderr):
-            yield
-    finally:
-        # The redirect context manager relies on these being installed;
-        # restore them after the context manager quits
-        sys.stdout = py_stdout
-        sys.stderr = py_stderr
-        sys.stdin = py_stdin
-        stream.cell_id = cell_id_old
+            _release_redirect(stream)
@@ -8,6 +8,7 @@ import io
 import signal
 import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union
 
@@ -22,6 +23,10 @@ from marimo._messaging.errors import (
 )
 from marimo._messaging.tracebacks import write_traceback
 from marimo._runtime import dataflow
+from marimo._runtime.context.types import (
+    get_context,
+    runtime_context_installed,
+)
 from marimo._runtime.control_flow import MarimoInterrupt, MarimoStopError
 from marimo._runtime.executor import (
     MarimoMissingRefError,
@@ -38,7 +43,7 @@ LOGGER = marimo_logger()
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    from marimo._runtime.context.types import ExecutionContext
+    from marimo._runtime.context.types import ExecutionContext, RuntimeContext
     from marimo._runtime.runner.hooks_on_finish import OnFinishHookType
     from marimo._runtime.runner.hooks_post_execution import (
         PostExecutionHookType,
@@ -86,6 +91,7 @@ class Runner:
             [CellId_t], contextlib._GeneratorContextManager[ExecutionContext]
         ]
         | None = None,
+        max_workers: int = 1,
         preparation_hooks: Sequence[PreparationHookType] | None = None,
         pre_execution_hooks: Sequence[PreExecutionHookType] | None = None,
         post_execution_hooks: Sequence[PostExecutionHookType] | None = None,
@@ -114,6 +120,9 @@ class Runner:
         self.glbls = glbls
         self.execution_mode: OnCellChangeType = execution_mode
         self.execution_type = execution_type
+        # when greater than 1, cells that don't depend on each other are
+        # run concurrently on a pool of this many threads
+        self.max_workers = max_workers
 
         # cells that the runner will run, subtracting out cells with errors:
         #
@@ -227,8 +236,11 @@ class Runner:
 
     def cancelled(self, cell_id: CellId_t) -> bool:
         """Return whether a cell has been cancelled."""
+        # cells running on worker threads may cancel their descendants
+        # while this is being called
         return any(
-            cell_id in cancelled for cancelled in self.cells_cancelled.values()
+            cell_id in cancelled
+            for cancelled in list(self.cells_cancelled.values())
         )
 
     def pending(self) -> bool:
@@ -517,49 +529,170 @@ class Runner:
                 blamed_cell = var_cell_id
         return ref, blamed_cell
 
-    async def run_all(self) -> None:
-        LOGGER.debug("Running preparation hooks")
-        for prep_hook in self.preparation_hooks:
-            prep_hook(self)
-
+    def _skip(self, cell_id: CellId_t) -> bool:
+        """Update the status of a cell that won't run; returns True if so."""
+        cell = self.graph.cells[cell_id]
+        # Hack: frontend sets status to queued on run, so we also have to
+        # set runtime_state to get FE to transition.
+        if self.cancelled(cell_id):
+            LOGGER.debug("%s cancelled", cell_id)
+            cell.set_run_result_status("cancelled")
+            cell.set_runtime_state("idle")
+            return True
+        if cell.config.disabled:
+            LOGGER.debug("%s disabled", cell_id)
+            cell.set_run_result_status("disabled")
+            cell.set_runtime_state("idle")
+            return True
+        if self.graph.is_disabled(cell_id):
+            LOGGER.debug("%s disabled transitively", cell_id)
+            cell.set_run_result_status("disabled")
+            cell.set_runtime_state("disabled-transitively")
+            return True
+        return False
+
+    async def _run_in_context(self, cell_id: CellId_t) -> RunResult:
+        """Run a cell in its execution context, if one was provided."""
+        if self.execution_context is not None:
+            with self.execution_context(cell_id) as exc_ctx:
+                run_result = await self.run(cell_id)
+                run_result.accumulated_output = exc_ctx.output
+            return run_result
+        return await self.run(cell_id)
+
+    def _run_on_worker(
+        self, runtime_context: RuntimeContext | None, cell_id: CellId_t
+    ) -> RunResult:
+        """Run a synchronous cell on a worker thread."""
+        # the runtime context is thread-local
+        with (
+            runtime_context.install()
+            if runtime_context is not None
+            else contextlib.nullcontext()
+        ):
+            # runs to completion without suspending, since the cell
+            # isn't a coroutine
+            return asyncio.run(self._run_in_context(cell_id))
+
+    def _run_pre_execution_hooks(self, cell: CellImpl) -> None:
+        LOGGER.debug("Running pre_execution hooks")
+        for pre_hook in self.pre_execution_hooks:
+            pre_hook(cell, self)
+
+    def _run_post_execution_hooks(
+        self, cell: CellImpl, run_result: RunResult
+    ) -> None:
+        LOGGER.debug("Running post_execution hooks")
+        for post_hook in self.post_execution_hooks:
+            post_hook(cell, self, run_result)
+
+    async def _run_all_serially(self) -> None:
         while self.pending():
             cell_id = self.pop_cell()
             LOGGER.debug("Cell runner processing %s", cell_id)
-            cell = self.graph.cells[cell_id]
-
-            # Update run result status for cells that won't run.
-            #
-            # Hack: frontend sets status to queued on run, so we also have to
-            # set runtime_state to get FE to transition.
-            if self.cancelled(cell_id):
-                LOGGER.debug("%s cancelled", cell_id)
-                cell.set_run_result_status("cancelled")
-                cell.set_runtime_state("idle")
-                continue
-            if cell.config.disabled:
-                LOGGER.debug("%s disabled", cell_id)
-                cell.set_run_result_status("disabled")
-                cell.set_runtime_state("idle")
-                continue
-            if self.graph.is_disabled(cell_id):
-                LOGGER.debug("%s disabled transitively", cell_id)
-                cell.set_run_result_status("disabled")
-                cell.set_runtime_state("disabled-transitively")
+            if self._skip(cell_id):
                 continue
 
-            LOGGER.debug("Running pre_execution hooks")
-            for pre_hook in self.pre_execution_hooks:
-                pre_hook(cell, self)
+            cell = self.graph.cells[cell_id]
+            self._run_pre_execution_hooks(cell)
             LOGGER.debug("Running cell %s", cell_id)
-            if self.execution_context is not None:
-                with self.execution_context(cell_id) as exc_ctx:
-                    run_result = await self.run(cell_id)
-                    run_result.accumulated_output = exc_ctx.output
-            else:
-                run_result = await self.run(cell_id)
-            LOGGER.debug("Running post_execution hooks")
-            for post_hook in self.post_execution_hooks:
-                post_hook(cell, self, run_result)
+            run_result = await self._run_in_context(cell_id)
+            self._run_post_execution_hooks(cell, run_result)
+
+    async def _run_all_concurrently(self) -> None:
+        """Run cells on a thread pool, as soon as their parents have run.
+
+        Hooks run on the calling thread, and a cell is only submitted once
+        all its parents among the cells to run have finished, so
+        exceptions still cancel descendants before they start. Coroutine
+        cells run on the event loop, one at a time and with no other cell
+        in flight. Cells running on worker threads can't be interrupted;
+        an interrupt only prevents further cells from starting.
+        """
+        pending_parents = {
+            cell_id: self.graph.parents[cell_id].intersection(
+                self.cells_to_run
+            )
+            for cell_id in self.cells_to_run
+        }
+        running: dict[asyncio.Future[RunResult], CellId_t] = {}
+        runtime_context = (
+            get_context() if runtime_context_installed() else None
+        )
+        loop = asyncio.get_running_loop()
+
+        def finish(cell_id: CellId_t) -> None:
+            for child in self.graph.children[cell_id]:
+                if child in pending_parents:
+                    pending_parents[child].discard(cell_id)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="marimo-runner",
+        ) as executor:
+            while self.pending() or running:
+                progressed = False
+                # Submit ready cells, in topological order
+                for cell_id in list(self.cells_to_run):
+                    if self.interrupted or len(running) >= self.max_workers:
+                        break
+                    if pending_parents[cell_id]:
+                        continue
+                    cell = self.graph.cells[cell_id]
+                    if cell.is_coroutine() and running:
+                        # wait for the pool to drain
+                        break
+
+                    self.cells_to_run.remove(cell_id)
+                    progressed = True
+                    LOGGER.debug("Cell runner processing %s", cell_id)
+                    if self._skip(cell_id):
+                        finish(cell_id)
+                        continue
+
+                    self._run_pre_execution_hooks(cell)
+                    LOGGER.debug("Running cell %s", cell_id)
+                    if cell.is_coroutine():
+                        run_result = await self._run_in_context(cell_id)
+                        self._run_post_execution_hooks(cell, run_result)
+                        finish(cell_id)
+                        break
+                    future = loop.run_in_executor(
+                        executor,
+                        self._run_on_worker,
+                        runtime_context,
+                        cell_id,
+                    )
+                    running[future] = cell_id
+
+                if not running:
+                    if not progressed:
+                        # Unreachable for acyclic graphs; don't spin.
+                        LOGGER.error("No cell is ready to run.")
+                        break
+                    continue
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    cell_id = running.pop(future)
+                    self._run_post_execution_hooks(
+                        self.graph.cells[cell_id], future.result()
+                    )
+                    finish(cell_id)
+
+    async def run_all(self) -> None:
+        LOGGER.debug("Running preparation hooks")
+        for prep_hook in self.preparation_hooks:
+            prep_hook(self)
+
+        # Strict execution swaps globals in and out around each cell, so it
+        # can't share them between concurrently running cells
+        if self.max_workers > 1 and self.execution_type == "relaxed":
+            await self._run_all_concurrently()
+        else:
+            await self._run_all_serially()
 
         LOGGER.debug("Running on_finish hooks")
         for finish_hook in self.on_finish_hooks:
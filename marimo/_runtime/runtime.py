@@ -59,7 +59,7 @@ from marimo._messaging.streams import (
 )
 from marimo._messaging.tracebacks import write_traceback
 from marimo._messaging.types import (
-    KernelMessage,
+    EncodedKernelMessage,
     Stderr,
     Stdin,
     Stdout,
@@ -434,10 +434,16 @@ class Kernel:
         self.execution_type: ExecutionType = user_config.get(
             "experimental", {}
         ).get("execution_type", "relaxed")
+        # Number of threads on which independent cells may run concurrently;
+        # cells run one at a time unless this is greater than 1.
+        self.max_workers: int = user_config.get("experimental", {}).get(
+            "max_workers", 1
+        )
         self._update_runtime_from_user_config(user_config)
 
-        # Set up the execution context
-        self.execution_context: Optional[ExecutionContext] = None
+        # Set up the execution context; it is tracked per thread, since the
+        # runner can execute independent cells concurrently on worker threads
+        self._execution_context = threading.local()
         # initializers to override construction of ui elements
         self.ui_initializers: dict[str, Any] = {}
         # errored cells
@@ -450,6 +456,15 @@ class Kernel:
             patches.patch_micropip(self.globals)
         exec("import marimo as __marimo__", self.globals)
 
+    @property
+    def execution_context(self) -> Optional[ExecutionContext]:
+        """Context of the cell running on the calling thread, if any."""
+        return getattr(self._execution_context, "value", None)
+
+    @execution_context.setter
+    def execution_context(self, value: Optional[ExecutionContext]) -> None:
+        self._execution_context.value = value
+
     def lazy(self) -> bool:
         return self.reactive_execution_mode == "lazy"
 
@@ -1199,6 +1214,7 @@ class Kernel:
             execution_mode=self.reactive_execution_mode,
             execution_type=self.execution_type,
             execution_context=self._install_execution_context,
+            max_workers=self.max_workers,
             preparation_hooks=self._preparation_hooks + [invalidate_state],
             pre_execution_hooks=self._pre_execution_hooks,
             post_execution_hooks=self._post_execution_hooks
@@ -1882,7 +1898,7 @@ def launch_kernel(
     set_ui_element_queue: QueueType[SetUIElementValueRequest],
     completion_queue: QueueType[CodeCompletionRequest],
     input_queue: QueueType[str],
-    stream_queue: queue.Queue[KernelMessage] | None,
+    stream_queue: queue.Queue[EncodedKernelMessage] | None,
     socket_addr: tuple[str, int] | None,
     is_edit_mode: bool,
     configs: dict[CellId_t, CellConfig],
@@ -1910,10 +1926,10 @@ def launch_kernel(
     # Create communication channels
     if socket_addr is not None:
         n_tries = 0
-        pipe: Optional[TypedConnection[KernelMessage]] = None
+        pipe: Optional[TypedConnection[EncodedKernelMessage]] = None
         while n_tries < 100:
             try:
-                pipe = TypedConnection[KernelMessage].of(
+                pipe = TypedConnection[EncodedKernelMessage].of(
                     connection.Client(socket_addr)
                 )
                 break
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import os
 from enum import IntEnum
 from typing import Any, Callable, Optional
 
@@ -25,8 +25,11 @@ from marimo._messaging.ops import (
     UpdateCellIdsRequest,
     serialize,
 )
-from marimo._messaging.types import KernelMessage, NoopStream
-from marimo._plugins.core.json_encoder import WebComponentEncoder
+from marimo._messaging.streams import (
+    encode_kernel_message,
+    kernel_message_op,
+)
+from marimo._messaging.types import EncodedKernelMessage, NoopStream
 from marimo._plugins.core.web_component import JSONType
 from marimo._runtime.params import QueryParams
 from marimo._server.api.deps import AppState
@@ -104,6 +107,11 @@ KIOSK_EXCLUDED_OPERATIONS = {
     CompletionResult.name,
 }
 
+# Bytes of messages that can be queued for a single websocket. A client
+# that falls further behind than this has its backlog dropped, and is
+# resynced from the session view once it catches up.
+MAX_QUEUED_BYTES = int(os.getenv("MARIMO_WS_MAX_QUEUED_BYTES", 64_000_000))
+
 
 class WebsocketHandler(SessionConsumer):
     """WebSocket that sessions use to send messages to frontends.
@@ -131,8 +139,14 @@ class WebsocketHandler(SessionConsumer):
         self.cancel_close_handle: Optional[asyncio.TimerHandle] = None
         self.heartbeat_task: Optional[asyncio.Task[None]] = None
         # Messages from the kernel are put in this queue
-        # to be sent to the frontend
-        self.message_queue: asyncio.Queue[KernelMessage]
+        # to be sent to the frontend; None requests a resync
+        self.message_queue: asyncio.Queue[Optional[EncodedKernelMessage]]
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queued_bytes = 0
+        # Set while the backlog has been dropped, until the resync
+        self._resync_pending = False
+        # Set while replaying the session view, which isn't size-limited
+        self._replaying = False
 
         super().__init__(consumer_id=ConsumerId(session_id))
 
@@ -185,8 +199,8 @@ class WebsocketHandler(SessionConsumer):
             last_executed_code = {}
             last_execution_time = {}
 
-        self.message_queue.put_nowait(
-            (
+        self.write_message(
+            encode_kernel_message(
                 KernelReady.name,
                 serialize(
                     KernelReady(
@@ -255,9 +269,7 @@ class WebsocketHandler(SessionConsumer):
             )
         )
 
-        for op in operations:
-            LOGGER.debug("Replaying operation %s", serialize(op))
-            self.write_operation(op)
+        self._replay_operations(operations)
 
     def _connect_kiosk(self, session: Session) -> None:
         """Connect to a kiosk session.
@@ -291,9 +303,53 @@ class WebsocketHandler(SessionConsumer):
             kiosk=True,
         )
 
-        for op in operations:
-            LOGGER.debug("Replaying operation %s", serialize(op))
-            self.write_operation(op)
+        self._replay_operations(operations)
+
+    def _replay_operations(self, operations: list[MessageOperation]) -> None:
+        self._replaying = True
+        try:
+            for op in operations:
+                LOGGER.debug("Replaying operation %s", serialize(op))
+                self.write_operation(op)
+        finally:
+            self._replaying = False
+
+    def _resync(self) -> None:
+        """Replay the session view to a client whose backlog was dropped."""
+        self._resync_pending = False
+        session = self.manager.get_session(self.session_id)
+        if session is None:
+            return
+
+        view = session.get_current_state()
+        self._replaying = True
+        try:
+            self._write_kernel_ready(
+                session=session,
+                resumed=True,
+                ui_values=view.ui_values,
+                last_executed_code=view.last_executed_code,
+                last_execution_time=view.last_execution_time,
+                kiosk=self.kiosk,
+            )
+        finally:
+            self._replaying = False
+        self._replay_operations(view.operations)
+
+    def _drop_backlog(self) -> None:
+        LOGGER.warning(
+            "Websocket for session %s is not keeping up; dropping %s "
+            "queued bytes and resyncing",
+            self.session_id,
+            self._queued_bytes,
+        )
+        while not self.message_queue.empty():
+            self.message_queue.get_nowait()
+        self._queued_bytes = 0
+        # Messages are dropped until the resync, since the session view
+        # already reflects them
+        self._resync_pending = True
+        self.message_queue.put_nowait(None)
 
     def _on_disconnect(
         self,
@@ -343,6 +399,7 @@ class WebsocketHandler(SessionConsumer):
         await self.websocket.accept()
         # Create a new queue for this session
         self.message_queue = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
 
         session_id = self.session_id
         mgr = self.manager
@@ -460,39 +517,16 @@ class WebsocketHandler(SessionConsumer):
 
         async def listen_for_messages() -> None:
             while True:
-                (op, data) = await self.message_queue.get()
-
-                if op in KIOSK_ONLY_OPERATIONS and not self.kiosk:
-                    LOGGER.debug(
-                        "Ignoring operation %s, not in kiosk mode",
-                        op,
-                    )
-                    continue
-                if op in KIOSK_EXCLUDED_OPERATIONS and self.kiosk:
-                    LOGGER.debug(
-                        "Ignoring operation %s, in kiosk mode",
-                        op,
-                    )
+                message = await self.message_queue.get()
+                if message is None:
+                    self._resync()
                     continue
+                self._queued_bytes -= len(message)
 
                 try:
-                    text = json.dumps(
-                        {
-                            "op": op,
-                            "data": data,
-                        },
-                        cls=WebComponentEncoder,
-                    )
-                except TypeError as e:
-                    # This is a deserialization error
-                    LOGGER.error(
-                        "Failed to send message to frontend: %s", str(e)
-                    )
-                    LOGGER.error("Message: %s", data)
-                    continue
-
-                try:
-                    await self.websocket.send_text(text)
+                    # Messages are already encoded as JSON (by the kernel,
+                    # or by write_operation), so they are sent as-is
+                    await self.websocket.send_text(message.decode("utf-8"))
                 except WebSocketDisconnect as e:
                     self._on_disconnect(
                         e,
@@ -538,14 +572,47 @@ class WebsocketHandler(SessionConsumer):
 
     def on_start(
         self,
-    ) -> Callable[[KernelMessage], None]:
-        def listener(response: KernelMessage) -> None:
-            self.message_queue.put_nowait(response)
+    ) -> Callable[[EncodedKernelMessage], None]:
+        def listener(response: EncodedKernelMessage) -> None:
+            # In run mode, kernel messages are distributed from a
+            # background thread
+            assert self._loop is not None
+            try:
+                self._loop.call_soon_threadsafe(self.write_message, response)
+            except RuntimeError:
+                # The event loop is closed; the server is shutting down
+                pass
 
         return listener
 
+    def _accepts(self, op: str) -> bool:
+        if op in KIOSK_ONLY_OPERATIONS and not self.kiosk:
+            LOGGER.debug("Ignoring operation %s, not in kiosk mode", op)
+            return False
+        if op in KIOSK_EXCLUDED_OPERATIONS and self.kiosk:
+            LOGGER.debug("Ignoring operation %s, in kiosk mode", op)
+            return False
+        return True
+
     def write_operation(self, op: MessageOperation) -> None:
-        self.message_queue.put_nowait((op.name, serialize(op)))
+        # Filter before encoding, so dropped operations cost nothing
+        if self._accepts(op.name):
+            self._enqueue(encode_kernel_message(op.name, serialize(op)))
+
+    def write_message(self, message: EncodedKernelMessage) -> None:
+        if self._accepts(kernel_message_op(message)):
+            self._enqueue(message)
+
+    def _enqueue(self, message: EncodedKernelMessage) -> None:
+        # Replays of the session view are never dropped
+        if not self._replaying:
+            if self._resync_pending:
+                return
+            if self._queued_bytes + len(message) > MAX_QUEUED_BYTES:
+                self._drop_backlog()
+                return
+        self._queued_bytes += len(message)
+        self.message_queue.put_nowait(message)
 
     def on_stop(self) -> None:
         # Cancel the heartbeat task, reader
@@ -6,7 +6,8 @@ from typing import Callable
 
 from marimo._config.manager import UserConfigManager
 from marimo._messaging.ops import MessageOperation
-from marimo._messaging.types import KernelMessage
+from marimo._messaging.streams import kernel_message_op
+from marimo._messaging.types import EncodedKernelMessage
 from marimo._runtime.requests import AppMetadata, SerializedCLIArgs
 from marimo._server.export.exporter import Exporter
 from marimo._server.file_manager import AppFileManager
@@ -108,9 +109,9 @@ async def run_app_until_completion(
     class NoopSessionConsumer(SessionConsumer):
         def on_start(
             self,
-        ) -> Callable[[KernelMessage], None]:
-            def listener(message: KernelMessage) -> None:
-                if message[0] == "completed-run":
+        ) -> Callable[[EncodedKernelMessage], None]:
+            def listener(message: EncodedKernelMessage) -> None:
+                if kernel_message_op(message) == "completed-run":
                     instantiated_event.set()
 
             return listener
@@ -121,6 +122,9 @@ async def run_app_until_completion(
         def write_operation(self, op: MessageOperation) -> None:
             pass
 
+        def write_message(self, message: EncodedKernelMessage) -> None:
+            pass
+
         def connection_state(self) -> ConnectionState:
             return ConnectionState.OPEN
 
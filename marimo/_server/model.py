@@ -9,7 +9,7 @@ from marimo._server.ids import ConsumerId
 
 if TYPE_CHECKING:
     from marimo._messaging.ops import MessageOperation
-    from marimo._messaging.types import KernelMessage
+    from marimo._messaging.types import EncodedKernelMessage
 
 
 class ConnectionState(Enum):
@@ -43,7 +43,7 @@ class SessionConsumer(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def on_start(
         self,
-    ) -> Callable[[KernelMessage], None]:
+    ) -> Callable[[EncodedKernelMessage], None]:
         """
         Start the session consumer
         and return a subscription function for the session consumer
@@ -58,6 +58,15 @@ class SessionConsumer(metaclass=abc.ABCMeta):
     def write_operation(self, op: MessageOperation) -> None:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def write_message(self, message: EncodedKernelMessage) -> None:
+        """Write an operation that has already been encoded
+
+        Rooms encode each broadcast operation once and share the bytes
+        with all of their consumers.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def connection_state(self) -> ConnectionState:
         raise NotImplementedError
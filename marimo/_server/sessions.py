@@ -41,8 +41,13 @@ from marimo._messaging.ops import (
     MessageOperation,
     Reload,
     UpdateCellCodes,
+    serialize,
 )
-from marimo._messaging.types import KernelMessage
+from marimo._messaging.streams import (
+    decode_kernel_message,
+    encode_kernel_message,
+)
+from marimo._messaging.types import EncodedKernelMessage
 from marimo._output.formatters.formatters import register_formatters
 from marimo._runtime import requests, runtime
 from marimo._runtime.requests import (
@@ -120,7 +125,7 @@ class QueueManager:
             else queue.Queue(maxsize=1)
         )
         self.stream_queue: (
-            "queue.Queue[Union[KernelMessage , None]]" | None
+            "queue.Queue[Union[EncodedKernelMessage, None]]" | None
         ) = None
         if not use_multiprocessing:
             self.stream_queue = queue.Queue()
@@ -175,7 +180,7 @@ class KernelManager:
         self.redirect_console_to_browser = redirect_console_to_browser
 
         # Only used in edit mode
-        self._read_conn: Optional[TypedConnection[KernelMessage]] = None
+        self._read_conn: Optional[TypedConnection[EncodedKernelMessage]] = None
         self._virtual_files_supported = virtual_files_supported
 
     def start_kernel(self) -> None:
@@ -264,7 +269,7 @@ class KernelManager:
         if listener is not None:
             # First thing kernel does is connect to the socket, so it's safe to
             # call accept
-            self._read_conn = TypedConnection[KernelMessage].of(
+            self._read_conn = TypedConnection[EncodedKernelMessage].of(
                 listener.accept()
             )
 
@@ -333,7 +338,7 @@ class KernelManager:
             self.queue_manager.control_queue.put(requests.StopRequest())
 
     @property
-    def kernel_connection(self) -> TypedConnection[KernelMessage]:
+    def kernel_connection(self) -> TypedConnection[EncodedKernelMessage]:
         assert self._read_conn is not None, "connection not started"
         return self._read_conn
 
@@ -384,8 +389,12 @@ class Room:
             disposable.dispose()
 
     def broadcast(self, operation: MessageOperation) -> None:
+        if not self.consumers:
+            return
+        # Encode once, no matter how many consumers are in the room
+        message = encode_kernel_message(operation.name, serialize(operation))
         for consumer in self.consumers:
-            consumer.write_operation(operation)
+            consumer.write_message(message)
 
     def close(self) -> None:
         for consumer in self.consumers:
@@ -463,20 +472,25 @@ class Session:
         # Reads from the kernel connection and distributes the
         # messages to each subscriber.
         self.message_distributor: (
-            ConnectionDistributor[KernelMessage]
-            | QueueDistributor[KernelMessage]
+            ConnectionDistributor | QueueDistributor[EncodedKernelMessage]
         )
         if self.kernel_manager.mode == SessionMode.EDIT:
-            self.message_distributor = ConnectionDistributor[KernelMessage](
+            self.message_distributor = ConnectionDistributor(
                 self.kernel_manager.kernel_connection
             )
         else:
             q = self._queue_manager.stream_queue
             assert q is not None
-            self.message_distributor = QueueDistributor[KernelMessage](queue=q)
+            self.message_distributor = QueueDistributor[EncodedKernelMessage](
+                queue=q
+            )
 
+        # The session view is the only consumer that decodes messages;
+        # the rest forward them as-is
         self.message_distributor.add_consumer(
-            lambda msg: self.session_view.add_raw_operation(msg[1])
+            lambda msg: self.session_view.add_raw_operation(
+                decode_kernel_message(msg)[1]
+            )
         )
         self.connect_consumer(session_consumer, main=True)
         self.message_distributor.start()
@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import threading
 import time
-from typing import TYPE_CHECKING, Callable, Generic, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar, Union
 
 from marimo import _loggers
 from marimo._utils.disposable import Disposable
@@ -21,11 +21,14 @@ T = TypeVar("T")
 Consumer = Callable[[T], None]
 
 
-class ConnectionDistributor(Generic[T]):
+class ConnectionDistributor:
     """
-    Used to distribute the response of a multiprocessing Connection to multiple
+    Used to distribute the messages of a multiprocessing Connection to multiple
     consumers.
 
+    Messages are received as raw bytes (sent with `send_bytes`), so nothing
+    is unpickled on the receiving end.
+
     This also handles adding and removing new consumers.
 
     NOTE: This class uses the `add_reader()` API, which requires the
@@ -37,11 +40,11 @@ class ConnectionDistributor(Generic[T]):
     for context.
     """
 
-    def __init__(self, input_connection: TypedConnection[T]) -> None:
-        self.consumers: list[Consumer[T]] = []
+    def __init__(self, input_connection: TypedConnection[Any]) -> None:
+        self.consumers: list[Consumer[bytes]] = []
         self.input_connection = input_connection
 
-    def add_consumer(self, consumer: Consumer[T]) -> Disposable:
+    def add_consumer(self, consumer: Consumer[bytes]) -> Disposable:
         """Add a consumer to the distributor."""
         self.consumers.append(consumer)
 
@@ -56,9 +59,7 @@ class ConnectionDistributor(Generic[T]):
         retry_sleep_seconds = 0.001
         while self.input_connection.poll():
             try:
-                # TODO: just recv_bytes (and change stream to send_bytes)
-                # to eliminate pickling overhead/bugs
-                response = self.input_connection.recv()
+                response = self.input_connection.recv_bytes()
             except BlockingIOError as e:
                 # recv() sporadically fails with EAGAIN, EDEADLK ...
                 LOGGER.warning(
@@ -89,7 +90,7 @@ class ConnectionDistributor(Generic[T]):
         """Flush the distributor."""
         while self.input_connection.poll():
             try:
-                self.input_connection.recv()
+                self.input_connection.recv_bytes()
             except EOFError:
                 break
 
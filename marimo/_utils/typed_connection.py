@@ -29,6 +29,12 @@ class TypedConnection(Generic[T]):
     def recv(self) -> T:
         return self._delegate.recv()  # type: ignore[no-any-return]
 
+    def send_bytes(self, buf: bytes) -> None:
+        self._delegate.send_bytes(buf)
+
+    def recv_bytes(self) -> bytes:
+        return self._delegate.recv_bytes()
+
     def poll(self) -> bool:
         return self._delegate.poll()
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import pathlib
 import subprocess
 import textwrap
+import time
 from typing import Any
 
 import pytest
@@ -68,6 +69,63 @@ class TestApp:
         assert (defs["y"], defs["z"]) == (1, 2)
         assert defs["a"] == 2
 
+    @staticmethod
+    def test_run_parallel() -> None:
+        app = App()
+
+        @app.cell
+        def __() -> tuple[Any]:
+            import time
+
+            return (time,)
+
+        @app.cell
+        def __(time: Any) -> tuple[int]:
+            time.sleep(0.5)
+            x = 1
+            x
+            return (x,)
+
+        @app.cell
+        def __(time: Any) -> tuple[int]:
+            time.sleep(0.5)
+            y = 2
+            return (y,)
+
+        @app.cell
+        def __(x: int, y: int) -> tuple[int]:
+            z = x + y
+            return (z,)
+
+        start = time.time()
+        outputs, defs = app.run(parallel=4)
+        assert time.time() - start < 0.9
+        assert outputs == (None, 1, None, None)
+        assert defs["z"] == 3
+
+    @staticmethod
+    def test_run_parallel_raises() -> None:
+        app = App()
+
+        @app.cell
+        def __() -> tuple[int]:
+            x = 0
+            return (x,)
+
+        @app.cell
+        def __(x: int) -> tuple[int]:
+            y = x
+            raise ValueError("boom")
+            return (y,)
+
+        @app.cell
+        def __(y: int) -> None:
+            y
+            return
+
+        with pytest.raises(ValueError, match="boom"):
+            app.run(parallel=True)
+
     @staticmethod
     def test_cycle() -> None:
         app = App()
@@ -563,6 +621,34 @@ def test_cli_args(tmp_path: pathlib.Path) -> None:
     assert "value2" in output
 
 
+
+def test_cli_parallel(tmp_path: pathlib.Path) -> None:
+    py_file = tmp_path / "parallel_script.py"
+    content = """
+    import marimo
+    app = marimo.App()
+
+    @app.cell
+    def __():
+        import threading
+        return threading,
+
+    @app.cell
+    def __(threading):
+        print(threading.current_thread().name)
+        return
+
+    if __name__ == "__main__":
+        app.run()
+    """
+    py_file.write_text(textwrap.dedent(content))
+    p = subprocess.run(
+        ["python", str(py_file), "--marimo-parallel=2"],
+        stdout=subprocess.PIPE,
+    )
+    assert p.returncode == 0
+    assert "marimo-script" in p.stdout.decode()
+
 class TestAppComposition:
     async def test_app_embed(self) -> None:
         app = App()
@@ -1,5 +1,10 @@
 import sys
 
+from marimo._messaging.streams import (
+    decode_kernel_message,
+    encode_kernel_message,
+    kernel_message_op,
+)
 from marimo._runtime.runtime import Kernel
 from tests.conftest import ExecReqProvider, MockedKernel
 
@@ -128,3 +133,13 @@ async def test_import_multiprocessing(
         ]
     )
     assert mocked_kernel.stdout.messages == ["hello", "\n"]
+
+
+class TestEncodedKernelMessage:
+    @staticmethod
+    def test_round_trip() -> None:
+        data = {"cell_id": "abc", "output": {"data": "<b>\u00e9</b>"}}
+        message = encode_kernel_message("cell-op", data)
+        assert isinstance(message, bytes)
+        assert kernel_message_op(message) == "cell-op"
+        assert decode_kernel_message(message) == ("cell-op", data)
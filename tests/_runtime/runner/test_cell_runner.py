@@ -1,4 +1,6 @@
 # Copyright 2024 Marimo. All rights reserved.
+import time
+
 from marimo._runtime.capture import capture_stderr
 from marimo._runtime.runner.cell_runner import Runner
 from marimo._runtime.runtime import Kernel
@@ -83,3 +85,80 @@ async def test_base_exception_caught(
     with capture_stderr() as buffer:
         await runner.run(er.cell_id)
     assert "line 3" in buffer.getvalue()
+
+
+async def test_independent_cells_run_concurrently(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.max_workers = 4
+    await k.run(
+        [
+            exec_req.get("import time"),
+            er := exec_req.get("delay = 0.5"),
+            exec_req.get("time.sleep(delay); x = 1"),
+            exec_req.get("time.sleep(delay); y = 2"),
+            exec_req.get("z = x + y"),
+        ]
+    )
+    assert not k.errors
+    assert k.globals["z"] == 3
+
+    # re-running the root re-runs both sleeping cells
+    start = time.time()
+    await k.run([er])
+    assert not k.errors
+    assert time.time() - start < 0.9
+    assert k.globals["z"] == 3
+
+
+async def test_concurrent_cells_attributed_to_own_cell(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.max_workers = 4
+    await k.run(
+        [
+            exec_req.get(
+                """
+                import time
+                from marimo._messaging.streams import console_cell_id
+                from marimo._runtime.context import get_context
+
+                def attribution():
+                    ctx = get_context()
+                    return ctx.cell_id, console_cell_id(ctx.stream)
+                """
+            ),
+            a := exec_req.get(
+                """
+                time.sleep(0.1)
+                a = attribution()
+                """
+            ),
+            b := exec_req.get(
+                """
+                time.sleep(0.1)
+                b = attribution()
+                """
+            ),
+        ]
+    )
+    assert not k.errors
+    assert k.globals["a"] == (a.cell_id, a.cell_id)
+    assert k.globals["b"] == (b.cell_id, b.cell_id)
+
+
+async def test_concurrent_error_cancels_descendants(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k.max_workers = 4
+    await k.run(
+        [
+            exec_req.get("x = 1"),
+            exec_req.get("y = x; raise ValueError"),
+            er := exec_req.get("z = y"),
+            exec_req.get("w = x"),
+        ]
+    )
+    assert "z" not in k.globals
+    assert k.globals["w"] == 1
+    assert k.graph.cells[er.cell_id].run_result_status == "cancelled"
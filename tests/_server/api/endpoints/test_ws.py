@@ -1,15 +1,24 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import asyncio
 from dataclasses import asdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
+from unittest.mock import MagicMock
 
 import pytest
 from starlette.websockets import WebSocketDisconnect
 
-from marimo._messaging.ops import KernelCapabilities, KernelReady
-from marimo._server.api.endpoints.ws import WebSocketCodes
+from marimo._messaging.ops import (
+    CompletionResult,
+    FocusCell,
+    KernelCapabilities,
+    KernelReady,
+)
+from marimo._messaging.streams import encode_kernel_message
+from marimo._server.api.endpoints import ws
+from marimo._server.api.endpoints.ws import WebSocketCodes, WebsocketHandler
 from marimo._server.model import SessionMode
 from marimo._server.sessions import SessionManager
 from marimo._utils.parse_dataclass import parse_raw
@@ -247,3 +256,62 @@ async def test_cannot_connect_kiosk_with_run_session(
 
     client.post("/api/kernel/shutdown", headers=HEADERS)
     session_manager.mode = SessionMode.EDIT
+
+
+def _websocket_handler(kiosk: bool = False) -> WebsocketHandler:
+    handler = WebsocketHandler(
+        websocket=MagicMock(),
+        manager=MagicMock(),
+        session_id="123",
+        mode=SessionMode.RUN,
+        file_key="test.py",
+        kiosk=kiosk,
+    )
+    handler.message_queue = asyncio.Queue()
+    return handler
+
+
+def test_ws_filters_operations_before_queueing() -> None:
+    handler = _websocket_handler(kiosk=False)
+    handler.write_operation(FocusCell(cell_id="Hbol"))
+    handler.write_message(
+        encode_kernel_message(FocusCell.name, {"cell_id": "Hbol"})
+    )
+    assert handler.message_queue.empty()
+
+    kiosk_handler = _websocket_handler(kiosk=True)
+    kiosk_handler.write_operation(
+        CompletionResult(completion_id="0", prefix_length=0, options=[])
+    )
+    assert kiosk_handler.message_queue.empty()
+    kiosk_handler.write_operation(FocusCell(cell_id="Hbol"))
+    assert kiosk_handler.message_queue.qsize() == 1
+
+
+def test_ws_drops_backlog_of_slow_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(ws, "MAX_QUEUED_BYTES", 150)
+    handler = _websocket_handler()
+    # no session to replay
+    handler.manager.get_session.return_value = None
+
+    message = encode_kernel_message("alert", {"title": "x" * 20})
+    handler.write_message(message)
+    handler.write_message(message)
+    assert handler.message_queue.qsize() == 2
+
+    # Overflowing drops the backlog and schedules a resync
+    for _ in range(5):
+        handler.write_message(message)
+    assert handler.message_queue.qsize() == 1
+    assert handler.message_queue.get_nowait() is None
+    assert handler._queued_bytes == 0
+
+    # Messages are dropped until the resync
+    handler.write_message(message)
+    assert handler.message_queue.empty()
+
+    handler._resync()
+    handler.write_message(message)
+    assert handler.message_queue.get_nowait() == message
@@ -13,6 +13,8 @@ from unittest.mock import MagicMock
 
 from marimo._ast.app import App, InternalApp
 from marimo._config.manager import UserConfigManager
+from marimo._messaging.ops import Alert
+from marimo._messaging.streams import decode_kernel_message
 from marimo._runtime.requests import (
     AppMetadata,
     CreationRequest,
@@ -21,7 +23,12 @@ from marimo._runtime.requests import (
 )
 from marimo._server.file_manager import AppFileManager
 from marimo._server.model import ConnectionState, SessionMode
-from marimo._server.sessions import KernelManager, QueueManager, Session
+from marimo._server.sessions import (
+    KernelManager,
+    QueueManager,
+    Room,
+    Session,
+)
 from marimo._server.utils import initialize_asyncio
 
 initialize_asyncio()
@@ -370,3 +377,24 @@ def test_session_with_kiosk_consumers() -> None:
     assert session.connection_state() == ConnectionState.CLOSED
     assert not session.room.consumers
     assert session.room.main_consumer is None
+
+
+def test_room_broadcast_encodes_once() -> None:
+    room = Room()
+    consumers: list[Any] = [MagicMock(), MagicMock(), MagicMock()]
+    for i, consumer in enumerate(consumers):
+        room.add_consumer(consumer, MagicMock(), f"consumer-{i}", main=i == 0)
+
+    room.broadcast(Alert(title="hello", description="world"))
+
+    messages = [
+        consumer.write_message.call_args.args[0] for consumer in consumers
+    ]
+    # every consumer shares the same encoded bytes
+    assert all(message is messages[0] for message in messages)
+    assert decode_kernel_message(messages[0]) == (
+        "alert",
+        {"title": "hello", "description": "world", "variant": None},
+    )
+    for consumer in consumers:
+        consumer.write_operation.assert_not_called()
@@ -16,7 +16,7 @@ def test_start(mock_get_event_loop: Any) -> None:
     mock_get_event_loop.return_value = MagicMock()
 
     mock_connection = MagicMock()
-    distributor = ConnectionDistributor[str](mock_connection)
+    distributor = ConnectionDistributor(mock_connection)
 
     # Define two mock consumer functions
     mock_consumer1 = MagicMock()
@@ -29,13 +29,13 @@ def test_start(mock_get_event_loop: Any) -> None:
     distributor.start()
 
     # Send
-    mock_connection.recv.side_effect = ["test message"]
+    mock_connection.recv_bytes.side_effect = [b"test message"]
     mock_connection.poll.return_value = True
     distributor._on_change()
 
     # Assert both consumers received the message
-    mock_consumer1.assert_called_once_with("test message")
-    mock_consumer2.assert_called_once_with("test message")
+    mock_consumer1.assert_called_once_with(b"test message")
+    mock_consumer2.assert_called_once_with(b"test message")
 
     # Remove one of the consumers
     distributor.consumers.remove(mock_consumer1)
@@ -45,13 +45,13 @@ def test_start(mock_get_event_loop: Any) -> None:
     mock_consumer2.reset_mock()
 
     # Send
-    mock_connection.recv.side_effect = ["test message"]
+    mock_connection.recv_bytes.side_effect = [b"test message"]
     mock_connection.poll.return_value = True
     distributor._on_change()
 
     # Assert only one consumer received the message
     mock_consumer1.assert_not_called()
-    mock_consumer2.assert_called_once_with("test message")
+    mock_consumer2.assert_called_once_with(b"test message")
 
     # Assert the event loop had the reader removed
     distributor.stop()